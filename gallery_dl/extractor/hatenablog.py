@@ -6,7 +6,6 @@
 
 """Extractors for https://hatenablog.com"""
 
-import re
 from .common import Extractor, Message
 from .. import text
 
@@ -30,9 +29,6 @@ class HatenablogExtractor(Extractor):
         Extractor.__init__(self, match)
         self.domain = match.group(1) or match.group(2)
 
-    def _init(self):
-        self._find_img = re.compile(r'<img +([^>]+)').finditer
-
     def _handle_article(self, article: str):
         extr = text.extract_from(article)
         date = text.parse_datetime(extr('<time datetime="', '"'))
@@ -43,12 +39,17 @@ class HatenablogExtractor(Extractor):
             '<div class="entry-content hatenablog-entry">', '</div>')
 
         images = []
-        for i in self._find_img(content):
-            attributes = i.group(1)
-            if 'class="hatena-fotolife"' not in attributes:
-                continue
-            image = text.unescape(text.extr(attributes, 'src="', '"'))
-            images.append(image)
+        marker = 'class="hatena-fotolife"'
+        find = content.find
+        pos = find(marker)
+        while pos >= 0:
+            beg = content.rfind("<img ", 0, pos)
+            end = find(">", pos)
+            if beg >= 0 and end >= 0 and find(">", beg, pos) < 0:
+                src = text.extr(content[beg:end], 'src="', '"')
+                if src:
+                    images.append(text.unescape(src))
+            pos = find(marker, pos + len(marker))
 
         data = {
             "domain": self.domain,
@@ -64,24 +65,20 @@ class HatenablogExtractor(Extractor):
 
 class HatenablogEntriesExtractor(HatenablogExtractor):
     """Base class for a list of entries"""
-    allowed_parameters = ()
+    allowed_parameters = frozenset(("page",))
 
     def __init__(self, match):
         HatenablogExtractor.__init__(self, match)
         self.path = match.group(3)
+        allowed = self.allowed_parameters
         self.query = {key: value for key, value in text.parse_query(
-            match.group(4)).items() if self._acceptable_query(key)}
-
-    def _init(self):
-        HatenablogExtractor._init(self)
-        self._find_pager_url = re.compile(
-            r' class="pager-next">\s*<a href="([^"]+)').search
+            match.group(4)).items() if key in allowed}
 
     def items(self):
         url = "https://" + self.domain + self.path
         query = self.query
 
-        while url:
+        while True:
             page = self.request(url, params=query).text
 
             extr = text.extract_from(page)
@@ -91,8 +88,11 @@ class HatenablogEntriesExtractor(HatenablogExtractor):
             else:
                 yield from self._handle_full_articles(extr)
 
-            match = self._find_pager_url(page)
-            url = text.unescape(match.group(1)) if match else None
+            pager = text.extr(page, ' class="pager-next">', '</span>')
+            url = text.extr(pager, '<a href="', '"')
+            if not url:
+                return
+            url = text.unescape(url)
             query = None
 
     def _handle_partial_articles(self, extr):
@@ -107,18 +107,15 @@ class HatenablogEntriesExtractor(HatenablogExtractor):
             yield Message.Queue, url, data
 
     def _handle_full_articles(self, extr):
+        handle_article = self._handle_article
         while True:
             attributes = extr('<article ', '>')
             if not attributes:
                 break
-            if "no-entry" in attributes:
-                continue
 
             article = extr('', '</article>')
-            yield from self._handle_article(article)
-
-    def _acceptable_query(self, key):
-        return key == "page" or key in self.allowed_parameters
+            if "no-entry" not in attributes:
+                yield from handle_article(article)
 
 
 class HatenablogEntryExtractor(HatenablogExtractor):
@@ -135,13 +132,18 @@ class HatenablogEntryExtractor(HatenablogExtractor):
         url = "https://" + self.domain + "/entry/" + self.path
         page = self.request(url).text
 
-        extr = text.extract_from(page)
-        while True:
-            attributes = extr('<article ', '>')
-            if "no-entry" in attributes:
-                continue
-            article = extr('', '</article>')
-            return self._handle_article(article)
+        pos = page.find("<article ")
+        while pos >= 0:
+            end = page.find(">", pos)
+            if end < 0:
+                break
+            if "no-entry" not in page[pos:end]:
+                last = page.find("</article>", end)
+                if last < 0:
+                    break
+                return self._handle_article(page[end+1:last])
+            pos = page.find("<article ", end)
+        return ()
 
 
 class HatenablogHomeExtractor(HatenablogEntriesExtractor):
@@ -164,4 +166,4 @@ class HatenablogSearchExtractor(HatenablogEntriesExtractor):
     subcategory = "search"
     pattern = BASE_PATTERN + r"(/search)" + QUERY_RE
     example = "https://BLOG.hatenablog.com/search?q=QUERY"
-    allowed_parameters = ("q",)
+    allowed_parameters = frozenset(("page", "q"))
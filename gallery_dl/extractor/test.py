@@ -40,28 +40,22 @@ class TestExtractor(Extractor):
         categories, subcategories, indices = match.groups()
         self.categories = self._split(categories)
         self.subcategories = self._split(subcategories)
-        self.indices = self._split(indices) or self
+        indices = self._split(indices)
+        self.indices = frozenset(
+            int(index) for index in indices if index) if indices else self
 
     def items(self):
-        extractors = extractor.extractors()
-
-        if self.categories:
-            extractors = [
-                extr for extr in extractors
-                if extr.category in self.categories
-            ]
-
-        if self.subcategories:
-            extractors = [
-                extr for extr in extractors
-                if extr.subcategory in self.subcategories
-            ]
+        categories = self.categories
+        subcategories = self.subcategories
+        indices = self.indices
 
         tests = [
             test
-            for extr in extractors
+            for extr in extractor.extractors()
+            if not categories or extr.category in categories
+            if not subcategories or extr.subcategory in subcategories
             for index, test in enumerate(extr._get_tests())
-            if str(index) in self.indices
+            if index in indices
         ]
 
         if not tests:
@@ -77,5 +71,5 @@ class TestExtractor(Extractor):
     @staticmethod
     def _split(value):
         if value and value != "*":
-            return value.split(",")
+            return frozenset(value.split(","))
         return None